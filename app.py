@@ -15,31 +15,278 @@ The backend is designed to be:
 @description Backend API for the MyGrammarly writing assistant
 """
 
-from flask import Flask, request, jsonify, render_template
-from language_tool_python import LanguageTool
+from flask import Flask, Response, request, render_template
+from flask.json.provider import DefaultJSONProvider
+import orjson
+import bisect
 import os
 import re
+import functools
 import logging
-from typing import Dict, List, Optional, Any
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Any, Tuple, Union
+
+# language_tool_python (and the requests stack it pulls in) is imported
+# lazily in create_tool to keep module import fast
+if TYPE_CHECKING:
+    from language_tool_python import LanguageTool
 
 # Configure logging for development and debugging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson
+    
+    Makes request.get_json() and jsonify() use orjson's C parser and encoder
+    instead of the stdlib json module. Non-native types still go through
+    Flask's default serializer hook.
+    """
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = 0
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Configuration Constants
 # =======================
 # These can be overridden via environment variables for deployment
 DEFAULT_LANGUAGE = os.environ.get("DEFAULT_LANGUAGE", "en-US")
 TEXT_MAX_CHARS = int(os.environ.get("TEXT_MAX_CHARS", "10000"))
+# Largest request body that can still hold TEXT_MAX_CHARS characters: a
+# character is at most 12 bytes once JSON-escaped (an ASCII-escaped
+# surrogate pair), plus headroom for the other fields
+MAX_REQUEST_BYTES = TEXT_MAX_CHARS * 12 + 64 * 1024
 CACHE_SIZE = int(os.environ.get("CACHE_SIZE", "1000"))
+# "1" warms the default LanguageTool at import, "async" warms it in a
+# background thread, "0" defers it to the first request
+PRELOAD_LANGUAGETOOL = os.environ.get("PRELOAD_LANGUAGETOOL", "1")
+# Texts longer than PARALLEL_CHECK_MIN_CHARS are split on paragraph
+# boundaries and checked by up to TOOL_POOL_SIZE LanguageTool instances per
+# language. Each instance is a separate Java process (hundreds of MB), so
+# set TOOL_POOL_SIZE=1 to disable parallel checking on small machines. With
+# LANGUAGETOOL_SERVER_URL set, it only caps concurrent chunk requests.
+TOOL_POOL_SIZE = max(1, int(os.environ.get("TOOL_POOL_SIZE", "4")))
+PARALLEL_CHECK_MIN_CHARS = int(os.environ.get("PARALLEL_CHECK_MIN_CHARS", "2000"))
+# Responses for texts up to CHECK_CACHE_MAX_CHARS are kept in an in-process
+# LRU of CHECK_CACHE_SIZE entries. A full entry (2000-char key plus a body
+# with a few dozen matches at ~540 bytes each) is roughly 15-30 KB, so the
+# default bounds the cache to about 8-16 MB per process (per gunicorn worker)
+CHECK_CACHE_SIZE = int(os.environ.get("CHECK_CACHE_SIZE", "512"))
+CHECK_CACHE_MAX_CHARS = int(os.environ.get("CHECK_CACHE_MAX_CHARS", "2000"))
+# Base URL of a running LanguageTool HTTP server (e.g. "http://localhost:8081").
+# When set, checks go to that server over pooled keep-alive connections and no
+# Java process is started per language.
+LANGUAGETOOL_SERVER_URL = os.environ.get("LANGUAGETOOL_SERVER_URL", "").rstrip("/")
+LANGUAGETOOL_SERVER_TIMEOUT = float(os.environ.get("LANGUAGETOOL_SERVER_TIMEOUT", "15"))
+BATCH_MAX_ITEMS = int(os.environ.get("BATCH_MAX_ITEMS", "50"))
+
+# Pre-compiled tokenizer for text metrics
+# One alternation classifies every non-whitespace run in a single scan:
+# words, sentence terminators, paragraph breaks and any other symbols
+_METRICS_RE = re.compile(
+    r'(?P<word>\w+)'
+    r'|(?P<sentence>[.!?]+)'
+    r'|(?P<paragraph>\n\n)'
+    r'|(?P<other>[^\w\s.!?]+)'
+)
+COMPLEX_WORD_MIN_CHARS = 7
+
+# Match classification tables
+# Categories are listed in priority order: when a match qualifies for
+# several, the earliest one wins
+_CLASSIFICATIONS: Dict[str, Dict[str, Any]] = {
+    # Spelling errors - highest confidence
+    'spelling': {
+        'category': 'spelling',
+        'confidence': 0.95,
+        'severity': 'high',
+        'explanation': 'Likely misspelled word or typographical error',
+    },
+    # Grammar errors - high confidence for structural issues
+    'grammar': {
+        'category': 'grammar',
+        'confidence': 0.90,
+        'severity': 'high',
+        'explanation': 'Grammatical error that affects meaning',
+    },
+    # Punctuation - usually clear-cut
+    'punctuation': {
+        'category': 'punctuation',
+        'confidence': 0.85,
+        'severity': 'medium',
+        'explanation': 'Punctuation rule or convention',
+    },
+    # Style suggestions - lower confidence, subjective
+    'style': {
+        'category': 'style',
+        'confidence': 0.70,
+        'severity': 'low',
+        'explanation': 'Style suggestion for improved readability',
+    },
+    'other': {
+        'category': 'other',
+        'confidence': 0.5,
+        'severity': 'medium',
+        'explanation': 'General writing suggestion',
+    },
+}
+_CATEGORY_PRIORITY = {name: rank for rank, name in enumerate(_CLASSIFICATIONS)}
+
+# LanguageTool issue types that map directly onto a category
+_ISSUE_TYPE_CATEGORIES = {
+    'misspelling': 'spelling',
+    'grammar': 'grammar',
+    'style': 'style',
+}
+
+# Rule ID keywords per category, evaluated in one regex call. Each branch is
+# a lookahead over the whole ID, so branch order (not keyword position)
+# decides the winner
+_RULE_ID_CATEGORY_RE = re.compile(
+    r'(?=.*(?:spell|morfologic|hunspell))(?P<spelling>)'
+    r'|(?=.*(?:grammar|agreement|verb|tense))(?P<grammar>)'
+    r'|(?=.*(?:punct|comma|apostrophe))(?P<punctuation>)'
+    r'|(?=.*(?:style|redundancy|wordiness))(?P<style>)',
+    re.DOTALL
+)
+
+# LanguageTool HTTP Server Client
+# ===============================
+
+class ServerMatch:
+    """
+    Match parsed from a LanguageTool server response
+    
+    Exposes the same instance attributes as language_tool_python's Match
+    (ruleId, errorLength, offsetInContext, ...) so the rest of the pipeline
+    handles both sources identically.
+    """
+    def __init__(self, raw: Dict[str, Any]):
+        rule = raw.get('rule') or {}
+        context = raw.get('context') or {}
+        urls = rule.get('urls') or []
+        
+        self.ruleId = rule.get('id')
+        self.ruleIssueType = rule.get('issueType')
+        self.category = (rule.get('category') or {}).get('id')
+        self.message = raw.get('message')
+        self.shortMessage = raw.get('shortMessage', '')
+        self.offset = raw.get('offset')
+        self.errorLength = raw.get('length')
+        self.context = context.get('text')
+        self.offsetInContext = context.get('offset')
+        self.replacements = [r.get('value') for r in raw.get('replacements') or []]
+        self.url = urls[0].get('value') if urls else None
+
+@functools.lru_cache(maxsize=None)
+def _languagetool_session() -> Any:
+    """Shared requests session with a connection pool for the LanguageTool server"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def _astral_utf16_positions(text: str) -> List[int]:
+    """UTF-16 offsets of characters outside the BMP (two UTF-16 units each)"""
+    positions = []
+    if text.isascii():
+        return positions
+    utf16_offset = 0
+    for char in text:
+        if ord(char) > 0xFFFF:
+            positions.append(utf16_offset)
+            utf16_offset += 2
+        else:
+            utf16_offset += 1
+    return positions
+
+class LanguageToolServerClient:
+    """
+    Checks text against a shared LanguageTool HTTP server
+    
+    Drop-in replacement for language_tool_python.LanguageTool's check() when
+    LANGUAGETOOL_SERVER_URL is set. One server JVM serves every language,
+    and the pooled session reuses HTTP connections across checks. The
+    session is opened lazily on the first check, so a client created in a
+    preloading gunicorn master never shares sockets with forked workers.
+    """
+    def __init__(self, language: str, url: str = LANGUAGETOOL_SERVER_URL):
+        self.language = language
+        self.check_url = f"{url}/v2/check"
+    
+    def check(self, text: str) -> List[ServerMatch]:
+        response = _languagetool_session().post(
+            self.check_url,
+            data={'language': self.language, 'text': text},
+            timeout=LANGUAGETOOL_SERVER_TIMEOUT
+        )
+        response.raise_for_status()
+        matches = [ServerMatch(raw) for raw in orjson.loads(response.content)['matches']]
+        
+        # The server counts offsets in UTF-16 units; convert to code points
+        astral_positions = _astral_utf16_positions(text)
+        if astral_positions:
+            for match in matches:
+                start = match.offset - bisect.bisect_left(astral_positions, match.offset)
+                end_utf16 = match.offset + match.errorLength
+                end = end_utf16 - bisect.bisect_left(astral_positions, end_utf16)
+                match.offset, match.errorLength = start, end - start
+        
+        return matches
+
+# Anything get_tool() may hand out: a local instance or the server client
+LanguageChecker = Union["LanguageTool", LanguageToolServerClient]
 
 # Global LanguageTool instance cache
 # Maintains one instance per language for performance
-_tools_by_language: Dict[str, LanguageTool] = {}
+_tools_by_language: Dict[str, LanguageChecker] = {}
 
-def get_tool(language: Optional[str] = None, goals: Optional[Dict] = None) -> LanguageTool:
+# Initialization locks (the server runs threaded)
+# _tools_lock only guards creation of the per-language locks; each
+# per-language lock ensures a single LanguageTool process is started
+_tools_lock = threading.Lock()
+_per_lang_locks: Dict[str, threading.Lock] = {}
+
+def create_tool(lang: str) -> LanguageChecker:
+    """
+    Start a new, uncached LanguageTool instance for a language
+    
+    Returns a LanguageToolServerClient when LANGUAGETOOL_SERVER_URL is set,
+    otherwise a language_tool_python instance with its own Java process.
+    """
+    if LANGUAGETOOL_SERVER_URL:
+        return LanguageToolServerClient(lang)
+    
+    from language_tool_python import LanguageTool
+    
+    # Initialize LanguageTool with performance optimizations
+    return LanguageTool(
+        lang,
+        config={
+            'cacheSize': CACHE_SIZE,
+            'pipelineCaching': True,
+        }
+    )
+
+def get_tool(language: Optional[str] = None, goals: Optional[Dict] = None) -> LanguageChecker:
     """
     Get or create a LanguageTool instance for the specified language
     
@@ -52,45 +299,46 @@ def get_tool(language: Optional[str] = None, goals: Optional[Dict] = None) -> La
         goals: Writing goals dictionary for configuration (future enhancement)
     
     Returns:
-        LanguageTool: Configured LanguageTool instance
+        LanguageChecker: Configured LanguageTool instance or server client
     
     Example:
         tool = get_tool('en-US', {'audience': 'academic', 'tone': 'formal'})
     """
     lang = language or DEFAULT_LANGUAGE
     
-    # Return cached instance if available
+    # Return cached instance if available (lock-free fast path)
     if lang in _tools_by_language:
         return _tools_by_language[lang]
     
-    # Create new instance with configuration
-    logger.info(f"Initializing LanguageTool for language: {lang}")
+    with _tools_lock:
+        lang_lock = _per_lang_locks.setdefault(lang, threading.Lock())
     
-    try:
-        # Initialize LanguageTool with performance optimizations
-        tool = LanguageTool(
-            lang,
-            config={
-                'cacheSize': CACHE_SIZE,
-                'pipelineCaching': True,
-            }
-        )
-        
-        # Configure tool based on writing goals (if provided)
-        if goals:
-            configure_tool_for_goals(tool, goals)
+    with lang_lock:
+        # Another thread may have finished initializing while we waited
+        if lang in _tools_by_language:
+            return _tools_by_language[lang]
         
-        # Cache the instance
-        _tools_by_language[lang] = tool
-        logger.info(f"LanguageTool initialized successfully for {lang}")
+        # Create new instance with configuration
+        logger.info(f"Initializing LanguageTool for language: {lang}")
         
-        return tool
-        
-    except Exception as e:
-        logger.error(f"Failed to initialize LanguageTool for {lang}: {e}")
-        raise
+        try:
+            tool = create_tool(lang)
+            
+            # Configure tool based on writing goals (if provided)
+            if goals:
+                configure_tool_for_goals(tool, goals)
+            
+            # Cache the instance
+            _tools_by_language[lang] = tool
+            logger.info(f"LanguageTool initialized successfully for {lang}")
+            
+            return tool
+            
+        except Exception as e:
+            logger.error(f"Failed to initialize LanguageTool for {lang}: {e}")
+            raise
 
-def configure_tool_for_goals(tool: LanguageTool, goals: Dict[str, str]) -> None:
+def configure_tool_for_goals(tool: LanguageChecker, goals: Dict[str, str]) -> None:
     """
     Configure LanguageTool based on user's writing goals
     
@@ -122,17 +370,233 @@ def configure_tool_for_goals(tool: LanguageTool, goals: Dict[str, str]) -> None:
     # if tone == 'Formal':
     #     tool.disable_rule('INFORMAL_CONTRACTIONS')
 
-def enhance_match_classification(match: Any, text: str) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=4096)
+def _classify_rule(rule_id: Optional[str], issue_type: Optional[str]) -> Tuple[str, str]:
     """
-    Enhance LanguageTool match with additional classification metadata
+    Resolve the standardized category for a (ruleId, ruleIssueType) pair
     
-    This function analyzes LanguageTool matches to provide more detailed
-    categorization and confidence scoring. This is particularly useful
-    for ML research and improving user experience.
+    LanguageTool draws rule IDs from a small finite set, so results are
+    memoized and repeated rules cost a single cache lookup.
+    
+    Returns:
+        Tuple of (category, lowercased issue type)
+    """
+    rule_id = (rule_id or '').lower()
+    issue_type = (issue_type or '').lower()
+    
+    # An exact issue type gives a baseline category; a rule ID keyword may
+    # still override it with a higher-priority category
+    category = _ISSUE_TYPE_CATEGORIES.get(issue_type, 'other')
+    if category != 'spelling':
+        rule_match = _RULE_ID_CATEGORY_RE.match(rule_id)
+        if rule_match and _CATEGORY_PRIORITY[rule_match.lastgroup] < _CATEGORY_PRIORITY[category]:
+            category = rule_match.lastgroup
+    
+    return category, issue_type
+
+# Match attribute names differ between language_tool_python versions but are
+# fixed for a given install, so they are resolved once from the first match
+_MATCH_ATTR_CANDIDATES = {
+    'contextOffset': ('offsetInContext', 'contextOffset'),
+    'shortMessage': ('shortMessage', 'shortmessage'),
+}
+_match_attr_names: Optional[Dict[str, str]] = None
+
+def resolve_match_attr_names(match: Any) -> Dict[str, str]:
+    """
+    Get the attribute names used by the installed LanguageTool Match class
     
     Args:
-        match: LanguageTool match object
-        text: Original text being analyzed
+        match: Any LanguageTool match object, used to probe attribute names
+    
+    Returns:
+        Dict mapping our field names to the Match attribute names
+    """
+    global _match_attr_names
+    if _match_attr_names is None:
+        _match_attr_names = {
+            field: next((name for name in candidates if hasattr(match, name)), candidates[0])
+            for field, candidates in _MATCH_ATTR_CANDIDATES.items()
+        }
+    return _match_attr_names
+
+# Parallel Checking
+# =================
+
+# Idle LanguageTool instances per language, plus how many each pool owns.
+# The default language's pool is filled up to TOOL_POOL_SIZE at preload;
+# other pools grow in the background once long texts are actually checked.
+# _tool_pools_lock guards both dicts.
+_tool_pools_by_language: Dict[str, "queue.Queue[LanguageTool]"] = {}
+_tool_pool_sizes: Dict[str, int] = {}
+_tool_pools_lock = threading.Lock()
+_check_executor = ThreadPoolExecutor(max_workers=TOOL_POOL_SIZE, thread_name_prefix="languagetool-check")
+
+def get_tool_pool(lang: str) -> "queue.Queue[LanguageTool]":
+    """Get the language's pool, seeding it with the cached get_tool() instance"""
+    pool = _tool_pools_by_language.get(lang)
+    if pool is None:
+        seed = get_tool(lang)
+        with _tool_pools_lock:
+            pool = _tool_pools_by_language.get(lang)
+            if pool is None:
+                pool = _tool_pools_by_language[lang] = queue.Queue()
+                pool.put(seed)
+                _tool_pool_sizes[lang] = 1
+    return pool
+
+def reserve_pool_slot(lang: str) -> Optional[int]:
+    """Claim room for one more pooled instance, returning the new pool size"""
+    with _tool_pools_lock:
+        pool_size = _tool_pool_sizes[lang]
+        if pool_size >= TOOL_POOL_SIZE:
+            return None
+        pool_size = _tool_pool_sizes[lang] = pool_size + 1
+        return pool_size
+
+def grow_tool_pool(lang: str, pool: "queue.Queue[LanguageTool]", pool_size: int) -> bool:
+    """
+    Start one more LanguageTool instance for a reserved pool slot
+    
+    Failures are logged and release the slot, so a later check can retry.
+    
+    Returns:
+        bool: Whether the instance was added to the pool
+    """
+    logger.info(f"Growing LanguageTool pool for {lang} to {pool_size} instances")
+    try:
+        tool = create_tool(lang)
+    except Exception:
+        logger.exception(f"Failed to grow LanguageTool pool for {lang}")
+        with _tool_pools_lock:
+            _tool_pool_sizes[lang] -= 1
+        return False
+    pool.put(tool)
+    return True
+
+def fill_tool_pool(lang: str) -> None:
+    """Start every remaining pooled instance for a language up front"""
+    pool = get_tool_pool(lang)
+    pool_size = reserve_pool_slot(lang)
+    while pool_size is not None and grow_tool_pool(lang, pool, pool_size):
+        pool_size = reserve_pool_slot(lang)
+
+@contextmanager
+def checkout_pool_tool(lang: str) -> Iterator["LanguageTool"]:
+    """
+    Borrow a LanguageTool instance from the language's pool
+    
+    When every instance is busy and the pool is below TOOL_POOL_SIZE, a new
+    one is started in a background thread. The caller never waits on that
+    JVM startup; it takes whichever instance is returned to the pool first.
+    """
+    pool = get_tool_pool(lang)
+    
+    try:
+        tool = pool.get_nowait()
+    except queue.Empty:
+        pool_size = reserve_pool_slot(lang)
+        if pool_size is not None:
+            threading.Thread(
+                target=grow_tool_pool,
+                args=(lang, pool, pool_size),
+                name="languagetool-pool-grow",
+                daemon=True,
+            ).start()
+        tool = pool.get()
+    
+    try:
+        yield tool
+    finally:
+        pool.put(tool)
+
+def split_paragraph_chunks(text: str, chunk_count: int) -> List[Tuple[int, str]]:
+    """
+    Split text into roughly equal chunks on paragraph boundaries
+    
+    Each chunk ends just after a blank-line separator (or at the end of the
+    text), so chunks concatenate back to the original text.
+    
+    Returns:
+        List of (start offset, chunk text) tuples
+    """
+    target = max(1, len(text) // chunk_count)
+    chunks = []
+    start = 0
+    
+    while len(text) - start > target:
+        split_at = text.find('\n\n', start + target)
+        if split_at == -1:
+            break
+        end = split_at + 2
+        chunks.append((start, text[start:end]))
+        start = end
+    
+    if start < len(text):
+        chunks.append((start, text[start:]))
+    
+    return chunks
+
+def _check_chunk(lang: str, start: int, chunk: str, tool: Optional[LanguageChecker] = None) -> List[Any]:
+    """
+    Check one chunk and shift offsets into the full text
+    
+    The chunk is checked with tool when given, otherwise with an instance
+    borrowed from the language's pool.
+    """
+    if tool is not None:
+        matches = tool.check(chunk)
+    else:
+        with checkout_pool_tool(lang) as tool:
+            matches = tool.check(chunk)
+    for match in matches:
+        match.offset += start
+    return matches
+
+def check_text(tool: LanguageChecker, language: str, text: str) -> List[Any]:
+    """
+    Run LanguageTool over text, in parallel chunks for long texts
+    
+    LanguageTool does its work in the Java process, so Python threads mostly
+    wait on sockets and chunks are processed concurrently across the pool.
+    With LANGUAGETOOL_SERVER_URL set, the shared server handles concurrent
+    requests itself, so every chunk goes through the one client and no pool
+    is built.
+    
+    Args:
+        tool: Cached LanguageTool instance, used directly for short texts
+        language: Language code of the tool
+        text: Text to check
+    
+    Returns:
+        LanguageTool matches in text order, offsets relative to text
+    """
+    if TOOL_POOL_SIZE == 1 or len(text) <= PARALLEL_CHECK_MIN_CHARS:
+        return tool.check(text)
+    
+    chunks = split_paragraph_chunks(text, TOOL_POOL_SIZE)
+    if len(chunks) == 1:
+        return tool.check(text)
+    
+    logger.info(f"Checking {len(chunks)} chunks in parallel")
+    chunk_tool = tool if LANGUAGETOOL_SERVER_URL else None
+    futures = [
+        _check_executor.submit(_check_chunk, language, start, chunk, chunk_tool)
+        for start, chunk in chunks
+    ]
+    return [match for future in futures for match in future.result()]
+
+def classify_match_rule(rule_id: Optional[str], issue_type: Optional[str]) -> Dict[str, Any]:
+    """
+    Build the classification metadata for a LanguageTool match
+    
+    Provides more detailed categorization and confidence scoring than
+    LanguageTool's own rule data. This is particularly useful for ML
+    research and improving user experience.
+    
+    Args:
+        rule_id: The match's LanguageTool rule ID
+        issue_type: The match's LanguageTool rule issue type
     
     Returns:
         Dict with enhanced classification data:
@@ -140,63 +604,106 @@ def enhance_match_classification(match: Any, text: str) -> Dict[str, Any]:
         - confidence: How confident we are in this categorization (0-1)
         - severity: Impact level (low, medium, high)
         - explanation: Human-readable explanation
+        - originalIssueType: Lowercased LanguageTool issue type
     """
-    rule_id = (match.ruleId or '').lower()
-    issue_type = (getattr(match, 'ruleIssueType', '') or '').lower()
+    category, original_issue_type = _classify_rule(rule_id, issue_type)
+    return {**_CLASSIFICATIONS[category], 'originalIssueType': original_issue_type}
+
+# Match attributes read by build_match_result besides the version-specific ones
+_MATCH_RESULT_ATTRS = (
+    'message', 'offset', 'errorLength', 'context', 'ruleId',
+    'ruleIssueType', 'category', 'replacements', 'url',
+)
+
+def build_match_result(match: Any, attr_names: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    Convert a LanguageTool match into a flat API result object
     
-    # Initialize classification
-    category = 'other'
-    confidence = 0.5
-    severity = 'medium'
-    explanation = 'General writing suggestion'
+    Context and rule fields are emitted as top-level keys (contextText,
+    ruleId, ...) rather than nested dicts, which keeps allocations and JSON
+    encoding work per match low.
     
-    # Spelling errors - highest confidence
-    if (issue_type == 'misspelling' or 
-        'spell' in rule_id or 
-        'morfologic' in rule_id or
-        'hunspell' in rule_id):
-        category = 'spelling'
-        confidence = 0.95
-        severity = 'high'
-        explanation = 'Likely misspelled word or typographical error'
+    Args:
+        match: LanguageTool match object
+        attr_names: Version-specific attribute names from resolve_match_attr_names
     
-    # Grammar errors - high confidence for structural issues
-    elif (issue_type == 'grammar' or 
-          'grammar' in rule_id or
-          'agreement' in rule_id or
-          'verb' in rule_id or
-          'tense' in rule_id):
-        category = 'grammar'
-        confidence = 0.90
-        severity = 'high'
-        explanation = 'Grammatical error that affects meaning'
+    Returns:
+        Result dict, or None if the match could not be processed
+    """
+    try:
+        # Match objects keep their data as plain instance attributes, so each
+        # one is read once from __dict__ instead of through getattr. Objects
+        # without them (e.g. property-based) are snapshotted via getattr.
+        fields = getattr(match, "__dict__", None)
+        if fields is None or "ruleId" not in fields:
+            fields = {
+                name: getattr(match, name)
+                for name in (*_MATCH_RESULT_ATTRS, *attr_names.values())
+                if hasattr(match, name)
+            }
+        
+        rule_id = fields["ruleId"]
+        issue_type = fields.get("ruleIssueType", "")
+        error_length = fields["errorLength"]
+        
+        # Normalize replacements to consistent format, limited to 5 suggestions.
+        # A LanguageTool version yields either all strings or all objects, so
+        # the element type is checked once per list rather than per item.
+        raw_replacements = (fields.get("replacements") or [])[:5]
+        if not raw_replacements:
+            normalized_replacements = []
+        elif type(raw_replacements[0]) is str:
+            normalized_replacements = [{"value": value} for value in raw_replacements]
+        else:
+            normalized_replacements = [
+                {"value": getattr(replacement, "value", None) or str(replacement)}
+                for replacement in raw_replacements
+            ]
+
+        result = {
+            "message": fields["message"],
+            "shortMessage": fields.get(attr_names['shortMessage'], ""),
+            "offset": fields["offset"],
+            "length": error_length,
+            "contextText": fields["context"],
+            "contextOffset": fields.get(attr_names['contextOffset'], 0) or 0,
+            "ruleId": rule_id,
+            "ruleIssueType": issue_type,
+            "ruleCategory": fields.get("category"),
+            "replacements": normalized_replacements,
+            "classification": classify_match_rule(rule_id, issue_type),
+        }
+        
+        # Add rule URL if available (for explanations)
+        rule_url = fields.get("url")
+        if rule_url:
+            result["ruleUrl"] = rule_url
+        
+        return result
+        
+    except Exception as e:
+        logger.warning(f"Error processing match: {e}")
+        # Callers skip failed matches and continue with the rest
+        return None
+
+def count_matches_by_category(matches: List[Any]) -> Dict[str, int]:
+    """
+    Tally LanguageTool matches per standardized category
     
-    # Punctuation - usually clear-cut
-    elif ('punct' in rule_id or 
-          'comma' in rule_id or
-          'apostrophe' in rule_id):
-        category = 'punctuation'
-        confidence = 0.85
-        severity = 'medium'
-        explanation = 'Punctuation rule or convention'
+    Used by summary-only checks, which need counts but not the full
+    per-match payload.
     
-    # Style suggestions - lower confidence, subjective
-    elif (issue_type == 'style' or 
-          'style' in rule_id or
-          'redundancy' in rule_id or
-          'wordiness' in rule_id):
-        category = 'style'
-        confidence = 0.70
-        severity = 'low'
-        explanation = 'Style suggestion for improved readability'
+    Args:
+        matches: LanguageTool match objects
     
-    return {
-        'category': category,
-        'confidence': confidence,
-        'severity': severity,
-        'explanation': explanation,
-        'originalIssueType': issue_type
-    }
+    Returns:
+        Dict mapping category name to number of matches
+    """
+    counts = Counter(
+        _classify_rule(match.ruleId, getattr(match, 'ruleIssueType', ''))[0]
+        for match in matches
+    )
+    return dict(counts)
 
 def calculate_text_metrics(text: str) -> Dict[str, Any]:
     """
@@ -222,17 +729,40 @@ def calculate_text_metrics(text: str) -> Dict[str, Any]:
             'readabilityScore': 0
         }
     
-    # Basic counts using regex patterns
-    words = len(re.findall(r'\b\w+\b', text))
-    sentences = len(re.findall(r'[.!?]+', text))
-    paragraphs = len([p for p in text.split('\n\n') if p.strip()])
-    
+    # Single pass over the text: every non-whitespace character belongs to
+    # exactly one word/sentence/other run, so their lengths sum to the
+    # non-whitespace character count
+    words = 0
+    sentences = 0
+    paragraphs = 0
+    complex_words = 0
+    non_ws_chars = 0
+    paragraph_has_content = False
+
+    for m in _METRICS_RE.finditer(text):
+        kind = m.lastgroup
+        if kind == 'paragraph':
+            if paragraph_has_content:
+                paragraphs += 1
+                paragraph_has_content = False
+            continue
+
+        length = m.end() - m.start()
+        non_ws_chars += length
+        paragraph_has_content = True
+        if kind == 'word':
+            words += 1
+            if length >= COMPLEX_WORD_MIN_CHARS:
+                complex_words += 1
+        elif kind == 'sentence':
+            sentences += 1
+
+    if paragraph_has_content:
+        paragraphs += 1
+
     # Calculate averages
     avg_words_per_sentence = words / max(sentences, 1)
-    avg_chars_per_word = len(re.sub(r'\s+', '', text)) / max(words, 1)
-    
-    # Complexity indicators
-    complex_words = len(re.findall(r'\b\w{7,}\b', text))  # Words with 7+ characters
+    avg_chars_per_word = non_ws_chars / max(words, 1)
     
     # Simple readability estimation (Flesch-like)
     if words > 0 and sentences > 0:
@@ -250,9 +780,140 @@ def calculate_text_metrics(text: str) -> Dict[str, Any]:
         'readabilityScore': max(0, min(100, readability_score))  # Clamp to 0-100
     }
 
+def json_response(payload: Any, status: int = 200) -> Response:
+    """
+    Build a JSON response encoded with orjson
+    
+    orjson's C encoder is several times faster than the stdlib json module
+    used by jsonify, which matters for /api/check payloads with many matches.
+    Unknown objects (e.g. a custom match category) are serialized via str().
+    """
+    return Response(orjson.dumps(payload, default=str), status=status, mimetype='application/json')
+
+def empty_check_response(language: str, goals: Any, summary: bool) -> Dict[str, Any]:
+    """Build the /api/check response payload for empty text"""
+    results_field = {"counts": {}} if summary else {"matches": []}
+    return {
+        **results_field,
+        "language": language,
+        "textLength": 0,
+        "metrics": calculate_text_metrics(""),
+        "goals": goals,
+    }
+
+class CheckError(Exception):
+    """Raised by run_check when LanguageTool fails; carries the API error payload"""
+    def __init__(self, error: str, detail: str):
+        super().__init__(error)
+        self.payload = {"error": error, "detail": detail}
+
+def run_check(text: str, language: str, goals: Any, summary: bool) -> Dict[str, Any]:
+    """
+    Check validated, non-empty text and build the /api/check response payload
+    
+    Args:
+        text: Text to check (at most TEXT_MAX_CHARS characters)
+        language: Language code
+        goals: Writing goals from the request
+        summary: Return per-category counts instead of full matches
+    
+    Returns:
+        Response payload dict
+    
+    Raises:
+        CheckError: If LanguageTool cannot be initialized or the check fails
+    """
+    # Get LanguageTool instance
+    try:
+        tool = get_tool(language, goals)
+    except Exception as e:
+        logger.error(f"Failed to get LanguageTool: {e}")
+        raise CheckError("Language tool initialization failed", str(e))
+
+    # Check text with LanguageTool
+    try:
+        logger.info(f"Checking text: {len(text)} chars, language: {language}")
+        matches = check_text(tool, language, text)
+        logger.info(f"Found {len(matches)} matches")
+    except Exception as e:
+        logger.error(f"LanguageTool check failed: {e}")
+        raise CheckError("Text checking failed", str(e))
+
+    # Summary mode: category counts only, no per-match payload
+    if summary:
+        return {
+            "counts": count_matches_by_category(matches),
+            "language": language,
+            "textLength": len(text),
+            "metrics": calculate_text_metrics(text),
+            "goals": goals,
+        }
+
+    # Process and enhance matches
+    results = []
+    if matches:
+        attr_names = resolve_match_attr_names(matches[0])
+        results = [
+            result for result in (build_match_result(match, attr_names) for match in matches)
+            if result is not None
+        ]
+
+    # Calculate text metrics
+    metrics = calculate_text_metrics(text)
+
+    # Return comprehensive response
+    return {
+        "matches": results,
+        "language": language,
+        "textLength": len(text),
+        "metrics": metrics,
+        "goals": goals,
+    }
+
+def goals_cache_key(goals: Any) -> Optional[bytes]:
+    """
+    Canonical JSON of the writing goals, used as a response cache key
+    
+    Returns None when the goals cannot be serialized (e.g. nested deeper than
+    orjson's 254-level dump limit, though parsing allows 1024), since such a
+    request could not be answered either.
+    """
+    try:
+        return orjson.dumps(goals, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return None
+
+@functools.lru_cache(maxsize=CHECK_CACHE_SIZE)
+def _cached_check_body(text: str, language: str, goals_key: bytes, summary: bool) -> bytes:
+    """
+    Serialized run_check response, memoized per request content
+    
+    UI clients re-check identical text often (typing pauses, shared sample
+    text), so hits skip both LanguageTool and JSON encoding. goals_key is the
+    canonical JSON of the goals, since dicts are not hashable. Failed checks
+    raise CheckError and are therefore never cached.
+    """
+    return orjson.dumps(run_check(text, language, orjson.loads(goals_key), summary), default=str)
+
 # API Routes
 # ==========
 
+_SUMMARY_FLAG_VALUES = ("1", "true")
+
+def is_summary_request(data: Dict[str, Any]) -> bool:
+    """
+    Whether the client asked for summary-only results
+    
+    Accepts "summary": true (or "1"/"true") in the JSON body, or
+    ?summary=1 / ?summary=true in the query string.
+    """
+    summary = data.get("summary")
+    return (
+        summary is True
+        or summary in _SUMMARY_FLAG_VALUES
+        or request.args.get("summary") in _SUMMARY_FLAG_VALUES
+    )
+
 @app.route("/")
 def index():
     """Serve the main application page"""
@@ -274,138 +935,179 @@ def api_check():
             "audience": "General",
             "intent": "Inform", 
             "tone": "Neutral"
-        } (optional)
+        } (optional),
+        "summary": true (optional, also accepted as ?summary=1)
     }
     
     Response format:
     {
-        "matches": [...],      // Enhanced LanguageTool matches
+        "matches": [...],      // Flat match objects (see build_match_result)
         "language": "en-US",   // Language used
         "textLength": 123,     // Character count
         "metrics": {...},      // Text quality metrics
         "goals": {...}         // Writing goals used
     }
+    
+    In summary mode "matches" is replaced by "counts", a mapping of
+    category to number of matches, and per-match details are skipped.
     """
+    # Reject oversized bodies before paying to parse them
+    if request.content_length is not None and request.content_length > MAX_REQUEST_BYTES:
+        logger.warning(f"Request body too large: {request.content_length} bytes (limit: {MAX_REQUEST_BYTES})")
+        return json_response({
+            "error": f"Text exceeds limit of {TEXT_MAX_CHARS} characters"
+        }, 413)
+
     # Parse request data
     data = request.get_json(silent=True) or {}
     text = data.get("text", "")
     language = data.get("language") or DEFAULT_LANGUAGE
     goals = data.get("goals", {})
+    summary = is_summary_request(data)
 
     # Validate input
     if not isinstance(text, str):
         logger.warning("Invalid text type received")
-        return jsonify({"error": "Invalid 'text' - must be string"}), 400
+        return json_response({"error": "Invalid 'text' - must be string"}, 400)
+    if not isinstance(language, str):
+        logger.warning("Invalid language type received")
+        return json_response({"error": "Invalid 'language' - must be string"}, 400)
+    goals_key = goals_cache_key(goals)
+    if goals_key is None:
+        return json_response({"error": "Invalid 'goals' - must be JSON-serializable"}, 400)
 
     # Handle empty text
     if len(text) == 0:
-        return jsonify({
-            "matches": [],
-            "language": language,
-            "textLength": 0,
-            "metrics": calculate_text_metrics(""),
-            "goals": goals
-        }), 200
+        return json_response(empty_check_response(language, goals, summary), 200)
 
     # Check text length limit
     if len(text) > TEXT_MAX_CHARS:
         logger.warning(f"Text too long: {len(text)} chars (limit: {TEXT_MAX_CHARS})")
-        return jsonify({
+        return json_response({
             "error": f"Text exceeds limit of {TEXT_MAX_CHARS} characters"
-        }), 413
+        }, 413)
 
-    # Get LanguageTool instance
+    # Run the check; short texts are served from the response cache
     try:
-        tool = get_tool(language, goals)
-    except Exception as e:
-        logger.error(f"Failed to get LanguageTool: {e}")
-        return jsonify({
-            "error": "Language tool initialization failed",
-            "detail": str(e)
-        }), 500
+        if len(text) <= CHECK_CACHE_MAX_CHARS:
+            return Response(
+                _cached_check_body(text, language, goals_key, summary),
+                mimetype='application/json'
+            )
+        return json_response(run_check(text, language, goals, summary), 200)
+    except CheckError as e:
+        return json_response(e.payload, 500)
 
-    # Check text with LanguageTool
+@app.route("/api/check_batch", methods=["POST"])
+def api_check_batch():
+    """
+    Batch text checking endpoint
+    
+    Checks several texts in one request with the same LanguageTool
+    instance, amortizing HTTP round-trips for clients that send many small
+    texts (e.g. one per edited paragraph). Items up to CHECK_CACHE_MAX_CHARS
+    share the /api/check response cache, so unchanged paragraphs are cheap.
+    
+    Request format:
+    {
+        "items": [{"id": "p1", "text": "Text to check"}, ...],
+        "language": "en-US" (optional),
+        "goals": {...} (optional),
+        "summary": true (optional, also accepted as ?summary=1)
+    }
+    
+    Response format:
+    {
+        "results": [
+            {"id": "p1", "matches": [...], "textLength": 13, "metrics": {...}, ...},
+            {"id": "p2", "error": "..."}   // Per-item validation or check errors
+        ],
+        "language": "en-US"
+    }
+    """
+    # Reject oversized bodies before paying to parse them
+    if request.content_length is not None and request.content_length > MAX_REQUEST_BYTES * BATCH_MAX_ITEMS:
+        logger.warning(f"Batch body too large: {request.content_length} bytes")
+        return json_response({"error": "Batch request too large"}, 413)
+
+    # Parse request data
+    data = request.get_json(silent=True) or {}
+    items = data.get("items")
+    language = data.get("language") or DEFAULT_LANGUAGE
+    goals = data.get("goals", {})
+    summary = is_summary_request(data)
+
+    # Validate input
+    if not isinstance(items, list):
+        logger.warning("Invalid batch items received")
+        return json_response({"error": "Invalid 'items' - must be a list"}, 400)
+    if not isinstance(language, str):
+        logger.warning("Invalid language type received")
+        return json_response({"error": "Invalid 'language' - must be string"}, 400)
+    goals_key = goals_cache_key(goals)
+    if goals_key is None:
+        return json_response({"error": "Invalid 'goals' - must be JSON-serializable"}, 400)
+    if len(items) > BATCH_MAX_ITEMS:
+        return json_response({
+            "error": f"Batch exceeds limit of {BATCH_MAX_ITEMS} items"
+        }, 413)
+
+    # Initialize the shared LanguageTool instance once for the whole batch
     try:
-        logger.info(f"Checking text: {len(text)} chars, language: {language}")
-        matches = tool.check(text)
-        logger.info(f"Found {len(matches)} matches")
+        get_tool(language, goals)
     except Exception as e:
-        logger.error(f"LanguageTool check failed: {e}")
-        return jsonify({
-            "error": "Text checking failed",
+        logger.error(f"Failed to get LanguageTool: {e}")
+        return json_response({
+            "error": "Language tool initialization failed",
             "detail": str(e)
-        }), 500
+        }, 500)
 
-    # Process and enhance matches
+    logger.info(f"Checking batch of {len(items)} items, language: {language}")
     results = []
-    for match in matches:
-        try:
-            # Get context offset (different versions use different attribute names)
-            context_offset = (
-                getattr(match, "offsetInContext", None) or
-                getattr(match, "contextOffset", None) or
-                0
-            )
+    for item in items:
+        item_id = item.get("id") if isinstance(item, dict) else None
+        text = item.get("text", "") if isinstance(item, dict) else None
 
-            # Normalize replacements to consistent format
-            raw_replacements = getattr(match, "replacements", []) or []
-            normalized_replacements = []
-            
-            for replacement in raw_replacements:
-                if isinstance(replacement, str):
-                    normalized_replacements.append({"value": replacement})
+        if not isinstance(text, str):
+            results.append({"id": item_id, "error": "Invalid 'text' - must be string"})
+        elif len(text) > TEXT_MAX_CHARS:
+            results.append({"id": item_id, "error": f"Text exceeds limit of {TEXT_MAX_CHARS} characters"})
+        elif len(text) == 0:
+            results.append({"id": item_id, **empty_check_response(language, goals, summary)})
+        else:
+            try:
+                # Short items go through the same response cache as /api/check
+                if len(text) <= CHECK_CACHE_MAX_CHARS:
+                    payload = orjson.loads(_cached_check_body(text, language, goals_key, summary))
                 else:
-                    value = getattr(replacement, "value", None) or str(replacement)
-                    normalized_replacements.append({"value": value})
-
-            # Get enhanced classification
-            classification = enhance_match_classification(match, text)
-
-            # Build result object
-            result = {
-                "message": match.message,
-                "shortMessage": (
-                    getattr(match, "shortMessage", "") or 
-                    getattr(match, "shortmessage", "")
-                ),
-                "offset": match.offset,
-                "length": match.errorLength,
-                "context": {
-                    "text": match.context,
-                    "offset": context_offset,
-                    "length": match.errorLength,
-                },
-                "rule": {
-                    "id": match.ruleId,
-                    "issueType": getattr(match, "ruleIssueType", ""),
-                    "category": getattr(match, "category", None),
-                },
-                "replacements": normalized_replacements[:5],  # Limit to 5 suggestions
-                "classification": classification,
-            }
-            
-            # Add rule URL if available (for explanations)
-            rule_url = getattr(match, "url", None)
-            if rule_url:
-                result["rule"]["url"] = rule_url
-            
-            results.append(result)
-            
-        except Exception as e:
-            logger.warning(f"Error processing match: {e}")
-            # Continue with other matches even if one fails
+                    payload = run_check(text, language, goals, summary)
+                results.append({"id": item_id, **payload})
+            except CheckError as e:
+                results.append({"id": item_id, **e.payload})
 
-    # Calculate text metrics
-    metrics = calculate_text_metrics(text)
+    return json_response({"results": results, "language": language}, 200)
 
-    # Return comprehensive response
-    return jsonify({
-        "matches": results,
-        "language": language,
-        "textLength": len(text),
-        "metrics": metrics,
-        "goals": goals,
-    }), 200
+# Constant endpoint bodies, serialized once at import
+# This would typically come from LanguageTool's supported languages
+# For now, we return a curated list of common languages
+SUPPORTED_LANGUAGES = [
+    {"code": "en-US", "name": "English (US)"},
+    {"code": "en-GB", "name": "English (UK)"},
+    {"code": "de-DE", "name": "German"},
+    {"code": "fr-FR", "name": "French"},
+    {"code": "es-ES", "name": "Spanish"},
+    {"code": "it-IT", "name": "Italian"},
+    {"code": "pt-PT", "name": "Portuguese"},
+    {"code": "nl-NL", "name": "Dutch"},
+    {"code": "pl-PL", "name": "Polish"},
+    {"code": "ru-RU", "name": "Russian"},
+]
+_LANGUAGES_BODY = orjson.dumps({"languages": SUPPORTED_LANGUAGES})
+_HEALTH_BODY = orjson.dumps({
+    "status": "ok",
+    "service": "MyGrammarly API",
+    "version": "1.0.0"
+})
 
 @app.route("/api/languages", methods=["GET"])
 def api_languages():
@@ -414,22 +1116,7 @@ def api_languages():
     
     Returns available language codes and names for the language selector.
     """
-    # This would typically come from LanguageTool's supported languages
-    # For now, we return a curated list of common languages
-    languages = [
-        {"code": "en-US", "name": "English (US)"},
-        {"code": "en-GB", "name": "English (UK)"},
-        {"code": "de-DE", "name": "German"},
-        {"code": "fr-FR", "name": "French"},
-        {"code": "es-ES", "name": "Spanish"},
-        {"code": "it-IT", "name": "Italian"},
-        {"code": "pt-PT", "name": "Portuguese"},
-        {"code": "nl-NL", "name": "Dutch"},
-        {"code": "pl-PL", "name": "Polish"},
-        {"code": "ru-RU", "name": "Russian"},
-    ]
-    
-    return jsonify({"languages": languages}), 200
+    return Response(_LANGUAGES_BODY, mimetype='application/json')
 
 @app.route("/health")
 def health():
@@ -439,11 +1126,7 @@ def health():
     Lightweight endpoint for monitoring and deployment checks.
     Does not initialize LanguageTool to avoid startup overhead.
     """
-    return jsonify({
-        "status": "ok",
-        "service": "MyGrammarly API",
-        "version": "1.0.0"
-    }), 200
+    return Response(_HEALTH_BODY, mimetype='application/json')
 
 # Error Handlers
 # ==============
@@ -451,13 +1134,45 @@ def health():
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify({"error": "Endpoint not found"}), 404
+    return json_response({"error": "Endpoint not found"}, 404)
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
     logger.error(f"Internal server error: {error}")
-    return jsonify({"error": "Internal server error"}), 500
+    return json_response({"error": "Internal server error"}, 500)
+
+# LanguageTool Preloading
+# =======================
+
+def preload_default_tool() -> None:
+    """
+    Warm the LanguageTool instances for DEFAULT_LANGUAGE
+    
+    Starting LanguageTool launches a JVM and loads rule files, which takes
+    seconds. Doing it here moves that cost to deploy time instead of the
+    first /api/check request. With TOOL_POOL_SIZE > 1 and no shared server,
+    the whole pool used for parallel checks is started as well. Failures
+    are logged, not raised, so the server still starts and retries lazily
+    on the first request.
+    """
+    try:
+        if TOOL_POOL_SIZE > 1 and not LANGUAGETOOL_SERVER_URL:
+            fill_tool_pool(DEFAULT_LANGUAGE)
+        else:
+            get_tool(DEFAULT_LANGUAGE)
+    except Exception:
+        logger.exception(f"Failed to preload LanguageTool for {DEFAULT_LANGUAGE}")
+
+# The debug reloader runs this module twice as __main__; only the child
+# (WERKZEUG_RUN_MAIN set) serves requests, so skip the parent's warm-up
+_is_reloader_parent = __name__ == "__main__" and not os.environ.get("WERKZEUG_RUN_MAIN")
+
+if not _is_reloader_parent:
+    if PRELOAD_LANGUAGETOOL == "1":
+        preload_default_tool()
+    elif PRELOAD_LANGUAGETOOL == "async":
+        threading.Thread(target=preload_default_tool, name="languagetool-preload", daemon=True).start()
 
 # Application Entry Point
 # =======================
@@ -0,0 +1,55 @@
+"""
+MyGrammarly Gunicorn Configuration
+
+Production server settings for running the Flask app under gunicorn:
+
+    gunicorn -c gunicorn_conf.py app:app
+
+The app is preloaded in the master process, which warms the default
+LanguageTool instance (see PRELOAD_LANGUAGETOOL in app.py) before forking.
+Workers then inherit the warmed instance copy-on-write and share its Java
+server instead of each paying the multi-second JVM startup. Only that one
+preloaded instance is shared; any further instance a worker creates starts
+its own Java server.
+
+Parallel chunk checking is disabled by default (TOOL_POOL_SIZE=1): worker
+processes already run checks in parallel, and each worker would otherwise
+start up to TOOL_POOL_SIZE-1 extra Java servers of its own in the middle of
+a request.
+
+Environment variables:
+- BIND: Address to listen on (default: "127.0.0.1:5001")
+- WEB_CONCURRENCY: Number of worker processes (default: half the CPUs, at least 2)
+- TOOL_POOL_SIZE: LanguageTool instances per language per worker (default here: 1)
+"""
+
+import os
+
+bind = os.environ.get("BIND", "127.0.0.1:5001")
+workers = int(os.environ.get("WEB_CONCURRENCY", max(2, (os.cpu_count() or 2) // 2)))
+preload_app = True
+
+# Workers provide the parallelism; per-worker LanguageTool pools would
+# multiply Java processes by the worker count
+os.environ.setdefault("TOOL_POOL_SIZE", "1")
+
+# Warm LanguageTool synchronously in the master: a background warm-up thread
+# would not survive the fork into workers
+os.environ.setdefault("PRELOAD_LANGUAGETOOL", "1")
+if os.environ["PRELOAD_LANGUAGETOOL"] == "async":
+    os.environ["PRELOAD_LANGUAGETOOL"] = "1"
+
+
+def post_fork(server, worker):
+    """
+    Detach the worker from the LanguageTool server started by the master
+
+    language_tool_python kills every server process it has registered when
+    the interpreter exits. Workers inherit that registry, so without this a
+    single worker restart would kill the Java server shared by all workers.
+    """
+    try:
+        from language_tool_python import server as languagetool_server
+    except ImportError:
+        return
+    languagetool_server.RUNNING_SERVER_PROCESSES.clear()
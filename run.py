@@ -7,22 +7,25 @@ This script provides a convenient way to start the server with proper
 error handling and informative messages.
 
 Usage:
-    python run.py
+    python run.py           # Flask development server
+    python run.py --prod    # gunicorn with gunicorn_conf.py
 
 The script will:
 1. Check for required dependencies
-2. Start the Flask development server
+2. Start the Flask development server (or gunicorn with --prod)
 3. Provide helpful startup messages and URLs
 """
 
+import os
 import sys
-import subprocess
 import importlib.util
 from pathlib import Path
 
-def check_dependencies():
+def check_dependencies(prod=False):
     """Check if required Python packages are installed"""
-    required_packages = ['flask', 'language_tool_python']
+    required_packages = ['flask', 'orjson', 'language_tool_python']
+    if prod:
+        required_packages.append('gunicorn')
     missing_packages = []
     
     for package in required_packages:
@@ -39,7 +42,11 @@ def check_dependencies():
 
 def main():
     """Main entry point"""
-    print("🚀 MyGrammarly Development Server")
+    import subprocess
+    
+    prod = '--prod' in sys.argv[1:]
+    
+    print("🚀 MyGrammarly Production Server" if prod else "🚀 MyGrammarly Development Server")
     print("=" * 40)
     
     # Check if we're in the correct directory
@@ -50,10 +57,18 @@ def main():
     
     # Check dependencies
     print("🔍 Checking dependencies...")
-    if not check_dependencies():
+    if not check_dependencies(prod):
         sys.exit(1)
     
     print("✅ All dependencies found")
+    
+    if prod:
+        # Replace this process with gunicorn; settings come from gunicorn_conf.py
+        print("\n📝 Starting MyGrammarly with gunicorn...")
+        print("-" * 40)
+        sys.stdout.flush()
+        os.execv(sys.executable, [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn_conf.py', 'app:app'])
+
     print("\n📝 Starting MyGrammarly server...")
     print("📍 URL: http://127.0.0.1:5001")
     print("🛑 Press Ctrl+C to stop the server")
@@ -286,10 +286,10 @@ function debounceFn(fn, delay) {
 // =============================================================================
 
 function categorizeError(match) {
-    if (!match || !match.rule) return 'other';
+    if (!match || !match.ruleId) return 'other';
     
-    const issueType = (match.rule.issueType || '').toLowerCase();
-    const ruleId = (match.rule.id || '').toLowerCase();
+    const issueType = (match.ruleIssueType || '').toLowerCase();
+    const ruleId = (match.ruleId || '').toLowerCase();
     
     if (isSpellingError(issueType, ruleId)) {
         return 'spelling';
@@ -435,11 +435,8 @@ function enhanceErrors(rawErrors, readabilityIssues = []) {
             shortMessage: 'Consider breaking it into shorter sentences or simplifying the language.',
             offset: issue.start,
             length: issue.end - issue.start,
-            context: {
-                text: issue.text,
-                offset: 0,
-                length: issue.text.length
-            },
+            contextText: issue.text,
+            contextOffset: 0,
             category: 'readability',
             type: 'readability',
             index: `readability-${index}`,
@@ -1070,9 +1067,9 @@ function Sidebar({
                                     
                                     <div className="issue-message">{issue.message}</div>
                                     
-                                    {issue.context?.text && (
+                                    {issue.contextText && (
                                         <div className="issue-context">
-                                            "{issue.context.text}"
+                                            "{issue.contextText}"
                                         </div>
                                     )}
                                     